@@ -9,8 +9,9 @@ load_dotenv()
 
 # Import functions from other project files
 from user_db import initialize_database, add_subscription, remove_subscription
-from scraper import group_and_send_alerts, load_preprocessed_tweets
+from scraper import group_and_send_alerts_sharded, load_preprocessed_tweets
 from tweet_store import initialize_tweet_database, save_tweets_to_db
+from tweet_archive import export_new_tweets, compact_archive, trend_counts
 import twitter_search
 
 # --- Configuration ---
@@ -18,6 +19,11 @@ MOCK_TWEETS_FILE = "moc_tweets.json"
 
 # --- Wrapper Functions ---
 
+@st.cache_data
+def load_trend_counts(group_by, start_date, end_date):
+    """Caches archive trend scans per date range; cleared after each export."""
+    return trend_counts(group_by, start_date=start_date, end_date=end_date)
+
 def get_subscriptions_df():
     """Gets subscriptions as a pandas DataFrame for Streamlit display."""
     import sqlite3
@@ -32,7 +38,7 @@ def get_subscriptions_df():
             con.close()
     return df
 
-def fetch_and_analyze_tweets_live():
+def fetch_and_analyze_tweets_live(analysis_workers=1):
     """Fetches and processes live tweets, including images, and saves them to the DB."""
     try:
         import ollama
@@ -66,27 +72,7 @@ def fetch_and_analyze_tweets_live():
             media_map = {media["media_key"]: media.get("url") for media in media_includes}
 
             with st.spinner("Analyzing tweets with local NLP and Vision models..."):
-                for tweet in json_response["data"]:
-                    location, disaster_type = twitter_search.extract_disaster_info(tweet['text'])
-                    image_url = "N/A"
-                    detected_landmark = "N/A"
-
-                    if "attachments" in tweet and "media_keys" in tweet["attachments"]:
-                        for key in tweet["attachments"]["media_keys"]:
-                            if key in media_map and media_map[key]:
-                                image_url = media_map[key]
-                                detected_landmark = twitter_search.analyze_image_for_landmarks(image_url)
-                                break
-
-                    results_list.append({
-                        "author_id": tweet['author_id'],
-                        "timestamp": tweet['created_at'],
-                        "text": tweet['text'],
-                        "extracted_location": location,
-                        "disaster_type": disaster_type,
-                        "image_url": image_url,
-                        "detected_landmark": detected_landmark
-                    })
+                results_list = twitter_search.analyze_tweets(json_response["data"], media_map, analysis_workers)
         else:
             st.warning("No tweets found for the query.")
 
@@ -146,11 +132,13 @@ col1, col2 = st.columns([1, 2])
 with col1:
     st.subheader("1. Fetch Tweets")
     use_mock_data = st.checkbox("Use Mock Data (moc_tweets.json)", value=True)
+    analysis_workers = st.number_input("Parallel analysis requests", min_value=1, max_value=16,
+                                       value=twitter_search.ANALYSIS_WORKERS)
     if st.button("Fetch and Analyze Tweets"):
         if use_mock_data:
             st.session_state.tweets = load_preprocessed_tweets(MOCK_TWEETS_FILE)
         else:
-            st.session_state.tweets = fetch_and_analyze_tweets_live()
+            st.session_state.tweets = fetch_and_analyze_tweets_live(analysis_workers)
         
         if st.session_state.tweets:
             st.success(f"Loaded {len(st.session_state.tweets)} tweets for review.")
@@ -175,10 +163,45 @@ with col2:
             column_order=("text", "image_url", "detected_landmark", "extracted_location", "disaster_type", "timestamp")
         )
         
+        alert_workers = st.number_input("Alert worker processes", min_value=1,
+                                        max_value=os.cpu_count() or 1, value=min(4, os.cpu_count() or 1))
         if st.button("Group and Send Alerts to Subscribers"):
             tweets_to_send = edited_tweets.to_dict('records')
             with st.spinner("Grouping tweets, checking for duplicates, and sending alerts..."):
-                group_and_send_alerts(tweets_to_send)
-                st.success("Alert processing complete! Check console for details.")
+                metrics = group_and_send_alerts_sharded(tweets_to_send, alert_workers)
+                st.success(f"Alert processing complete! {len(metrics['alerts_sent'])} alert(s) sent, "
+                           f"{metrics['emails_sent']} email(s) delivered, {metrics['emails_failed']} failed, "
+                           f"{metrics['skipped_duplicates']} duplicate(s) skipped.")
+    else:
+        st.write("No tweets fetched yet. Click the button on the left.")
+
+st.header("Historical Analytics")
+st.info("Trends are read from the Parquet archive. Export to include newly saved tweets.")
+
+archive_col1, archive_col2 = st.columns([1, 2])
+
+with archive_col1:
+    if st.button("Export New Tweets to Archive"):
+        with st.spinner("Exporting tweets.db to the Parquet archive..."):
+            exported = export_new_tweets()
+            compact_archive()
+            load_trend_counts.clear()
+        st.success(f"Archived {exported} new tweets.")
+    start_date = st.date_input("From", value=None)
+    end_date = st.date_input("To", value=None)
+    include_unknown = st.checkbox("Include tweets without a location or disaster", value=False)
+
+with archive_col2:
+    city_trends = load_trend_counts(("location", "disaster"), start_date, end_date)
+    hourly_trends = load_trend_counts(("hour", "disaster"), start_date, end_date)
+    if not include_unknown:
+        city_trends = city_trends[(city_trends["location"] != "n/a") & (city_trends["disaster"] != "n/a")]
+        hourly_trends = hourly_trends[hourly_trends["disaster"] != "n/a"]
+
+    if city_trends.empty:
+        st.write("No archived tweets match the selected range yet.")
     else:
-        st.write("No tweets fetched yet. Click the button on the left.")
\ No newline at end of file
+        st.subheader("Reports by City and Disaster")
+        st.bar_chart(city_trends.pivot_table(index="location", columns="disaster", values="count", fill_value=0))
+        st.subheader("Reports by Hour of Day (UTC)")
+        st.line_chart(hourly_trends.pivot_table(index="hour", columns="disaster", values="count", fill_value=0))
\ No newline at end of file
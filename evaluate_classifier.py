@@ -0,0 +1,311 @@
+import hashlib
+import inspect
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from scraper import load_preprocessed_tweets
+from locations import normalize_location
+from conceptualconfusion import plot_confusion_matrix
+from conceptualf1 import plot_f1_scores
+
+# --- Configuration ---
+# Labels in these files come from the analysis pipeline itself, so they cannot grade it
+PIPELINE_OUTPUT_FILES = {"moc_tweets.json"}
+PREDICTION_CACHE_FILE = "eval_cache.json"
+CLASSES = ['Flood', 'Fire', 'Traffic', 'Earthquake', 'None/Other']
+OTHER_CLASS = len(CLASSES) - 1
+
+# --- Alternative Extractors ---
+
+# Generic baseline rules; the first matching type wins
+DISASTER_KEYWORDS = {
+    "Flood": r"flood|inundat|deluge|submerged",
+    "Fire": r"fire|blaze|flames",
+    "Earthquake": r"earthquake|tremor|quake",
+    "Traffic": r"traffic|gridlock|congestion"
+}
+KNOWN_LOCATIONS = ["bengaluru", "bangalore", "mumbai", "bombay", "delhi", "chennai",
+                   "kolkata", "hyderabad", "pune", "ahmedabad"]
+
+def keyword_extract_disaster_info(tweet_text):
+    """
+    Rule-based alternative to extract_disaster_info(): matches known cities and
+    disaster keywords. Returns (location, disaster_type) in the same format.
+    """
+    text = tweet_text.lower()
+    location = next((loc for loc in KNOWN_LOCATIONS if loc in text), "N/A")
+    disaster_type = next((name for name, pattern in DISASTER_KEYWORDS.items()
+                          if re.search(pattern, text)), "N/A")
+    return location, disaster_type
+
+def extractor_fingerprint(function, model_digest=""):
+    """Hashes a function's source and model digest so cached predictions expire when either changes."""
+    source = inspect.getsource(function) + model_digest
+    return hashlib.sha256(source.encode("utf-8")).hexdigest()[:12]
+
+def get_extractors():
+    """
+    Returns the extractors to evaluate as {name: (function, fingerprint)}. A fingerprint
+    of None means the extractor is cheap enough to never cache. The LLM extractor is
+    skipped, with the underlying error, if it cannot be imported or Ollama is not reachable.
+    """
+    extractors = {}
+    try:
+        import ollama
+        from twitter_search import extract_disaster_info
+        # extract_disaster_info() swallows connection errors, so probe the server directly
+        models = ollama.list().models
+        model_digest = next((m.digest for m in models if m.model.split(":")[0] == "llama3"), None)
+        if model_digest is None:
+            raise RuntimeError("the 'llama3' model is not available on the Ollama server")
+        extractors["llama3"] = (extract_disaster_info, extractor_fingerprint(extract_disaster_info, model_digest))
+    except Exception as e:
+        print(f"⚠️ Skipping the llama3 extractor: {type(e).__name__}: {e}")
+    extractors["keywords"] = (keyword_extract_disaster_info, None)
+    return extractors
+
+# --- Prediction Cache ---
+
+def load_prediction_cache():
+    """Loads cached predictions so unchanged tweets are not sent to the model again."""
+    if not os.path.exists(PREDICTION_CACHE_FILE):
+        return {}
+    with open(PREDICTION_CACHE_FILE, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def save_prediction_cache(cache):
+    """Writes the prediction cache back to disk."""
+    with open(PREDICTION_CACHE_FILE, "w", encoding="utf-8") as f:
+        json.dump(cache, f, indent=2)
+
+def cache_key(extractor_name, fingerprint, tweet_text):
+    """Builds the cache key for one extractor version and tweet text."""
+    return f"{extractor_name}:{fingerprint}:{hashlib.sha256(tweet_text.encode('utf-8')).hexdigest()}"
+
+# --- Running Extractors ---
+
+def timed_call(extractor, tweet_text):
+    """Runs an extractor on one tweet and returns its prediction with the latency in seconds."""
+    start = time.perf_counter()
+    try:
+        location, disaster_type = extractor(tweet_text)
+    except Exception as e:
+        # Recorded like extract_disaster_info() failures so it lands in the failed count
+        print(f"Extractor Error: {type(e).__name__}: {e}")
+        location, disaster_type = "Error", "Error"
+    latency = time.perf_counter() - start
+    return {"location": location, "disaster_type": disaster_type, "latency": latency}
+
+def is_failed(prediction):
+    """extract_disaster_info() reports model failures as ("Error", "Error")."""
+    return prediction["disaster_type"] == "Error"
+
+def run_extractor(name, extractor, fingerprint, texts, cache, max_workers=1):
+    """
+    Returns one prediction per text. Cached predictions (with their originally
+    measured latency) are reused; the rest are computed with max_workers threads.
+    With more than one worker, calls to a single model server queue up and the
+    measured latency includes that wait.
+    """
+    keys = [cache_key(name, fingerprint, text) if fingerprint else None for text in texts]
+    results = [cache.get(key) if key else None for key in keys]
+    missing = [i for i, result in enumerate(results) if result is None]
+
+    if missing:
+        print(f"🔍 Running {name} on {len(missing)} uncached tweet(s) with {max_workers} worker(s)...")
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            predictions = executor.map(lambda i: timed_call(extractor, texts[i]), missing)
+            for i, prediction in zip(missing, predictions):
+                prediction["workers"] = max_workers
+                results[i] = prediction
+                # Failed calls are retried on the next run instead of being cached
+                if keys[i] and not is_failed(prediction):
+                    cache[keys[i]] = prediction
+
+    return results
+
+# --- Metrics ---
+
+def to_class_indices(labels):
+    """Maps disaster labels to CLASSES indices; anything unrecognized becomes None/Other."""
+    lookup = {name.lower(): i for i, name in enumerate(CLASSES[:OTHER_CLASS])}
+    return np.array([lookup.get(str(label).strip().lower(), OTHER_CLASS) for label in labels], dtype=int)
+
+def confusion_matrix(y_true, y_pred, num_classes=len(CLASSES)):
+    """Builds the confusion matrix (rows: actual, columns: predicted) with a single bincount."""
+    counts = np.bincount(y_true * num_classes + y_pred, minlength=num_classes * num_classes)
+    return counts.reshape(num_classes, num_classes)
+
+def per_class_scores(cm):
+    """Computes per-class precision, recall and F1 from a confusion matrix."""
+    true_positives = np.diag(cm).astype(float)
+    predicted = cm.sum(axis=0)
+    actual = cm.sum(axis=1)
+
+    precision = np.divide(true_positives, predicted, out=np.zeros_like(true_positives), where=predicted > 0)
+    recall = np.divide(true_positives, actual, out=np.zeros_like(true_positives), where=actual > 0)
+    denominator = precision + recall
+    f1 = np.divide(2 * precision * recall, denominator, out=np.zeros_like(true_positives), where=denominator > 0)
+    return precision, recall, f1
+
+def latency_summary(latencies):
+    """Summarizes per-call latencies in milliseconds."""
+    latencies_ms = np.asarray(latencies) * 1000
+    p50, p95, p99 = np.percentile(latencies_ms, [50, 95, 99])
+    return {"mean_ms": latencies_ms.mean(), "p50_ms": p50, "p95_ms": p95, "p99_ms": p99}
+
+def evaluate(labeled_tweets, extractors, max_workers=1):
+    """
+    Runs every extractor over the labeled tweets and returns a result dictionary
+    per extractor with the confusion matrix, per-class scores and latency summary.
+    Failed calls are counted separately and excluded from scores and latencies.
+    """
+    if not labeled_tweets:
+        raise ValueError("No labeled tweets to evaluate.")
+
+    texts = [tweet["text"] for tweet in labeled_tweets]
+    all_true = to_class_indices([tweet.get("disaster_type", "N/A") for tweet in labeled_tweets])
+    all_true_locations = np.array([normalize_location(tweet.get("extracted_location") or "N/A")
+                                   for tweet in labeled_tweets])
+
+    cache = load_prediction_cache()
+    results = {}
+    try:
+        for name, (extractor, fingerprint) in extractors.items():
+            predictions = run_extractor(name, extractor, fingerprint, texts, cache, max_workers)
+            succeeded = np.array([not is_failed(p) for p in predictions], dtype=bool)
+            if not succeeded.any():
+                print(f"⚠️ Every {name} call failed. Skipping it.")
+                continue
+            predictions = [p for p, ok in zip(predictions, succeeded) if ok]
+
+            y_true = all_true[succeeded]
+            y_pred = to_class_indices([p["disaster_type"] for p in predictions])
+            pred_locations = np.array([normalize_location(p["location"] or "N/A") for p in predictions])
+            # Only classes that appear in the labels count towards the macro average
+            present = np.bincount(y_true, minlength=len(CLASSES)) > 0
+
+            cm = confusion_matrix(y_true, y_pred)
+            precision, recall, f1 = per_class_scores(cm)
+            results[name] = {
+                "confusion_matrix": cm,
+                "precision": precision,
+                "recall": recall,
+                "f1": f1,
+                "present": present,
+                "scored": len(predictions),
+                "failed": int((~succeeded).sum()),
+                "accuracy": np.trace(cm) / cm.sum(),
+                "macro_f1": f1[present].mean(),
+                "location_accuracy": (all_true_locations[succeeded] == pred_locations).mean(),
+                "latency": latency_summary([p["latency"] for p in predictions]),
+                "workers": max(p.get("workers", 1) for p in predictions)
+            }
+    finally:
+        save_prediction_cache(cache)
+
+    return results
+
+def select_fastest(results, min_macro_f1):
+    """Returns the name of the fastest (by p95 latency) extractor meeting the F1 bar, or None."""
+    qualifying = [name for name, result in results.items() if result["macro_f1"] >= min_macro_f1]
+    if not qualifying:
+        return None
+    return min(qualifying, key=lambda name: results[name]["latency"]["p95_ms"])
+
+# --- Reporting ---
+
+def print_report(results):
+    """Prints a per-extractor summary table and per-class scores."""
+    print("\n--- Accuracy vs. Latency ---")
+    print(f"{'Extractor':<12}{'Scored':>8}{'Failed':>8}{'Accuracy':>10}{'Macro F1':>10}{'Loc Acc':>10}"
+          f"{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'Workers':>9}")
+    for name, result in results.items():
+        latency = result["latency"]
+        print(f"{name:<12}{result['scored']:>8}{result['failed']:>8}{result['accuracy']:>10.2f}"
+              f"{result['macro_f1']:>10.2f}{result['location_accuracy']:>10.2f}"
+              f"{latency['p50_ms']:>10.1f}{latency['p95_ms']:>10.1f}{latency['p99_ms']:>10.1f}{result['workers']:>9}")
+    if any(result["workers"] > 1 for result in results.values()):
+        print("Note: with more than one worker, latencies include time spent queued at the model server.")
+
+    for name, result in results.items():
+        print(f"\n--- {name}: Per-Class Scores ---")
+        for i, class_name in enumerate(CLASSES):
+            if not result["present"][i]:
+                print(f"{class_name:<12} no labeled examples (excluded from macro F1)")
+                continue
+            print(f"{class_name:<12} P={result['precision'][i]:.2f} R={result['recall'][i]:.2f} F1={result['f1'][i]:.2f}")
+
+def save_figures(results):
+    """Emits the confusion matrix and F1 figures for every extractor from the measured data."""
+    for name, result in results.items():
+        plot_confusion_matrix(result["confusion_matrix"], CLASSES,
+                              f"Confusion Matrix: {name} (N={result['scored']})",
+                              f"Confusion_Matrix_{name}.png")
+        # Only disaster types with labeled examples have a meaningful F1
+        shown = np.flatnonzero(result["present"][:OTHER_CLASS])
+        if not shown.size:
+            continue
+        plot_f1_scores([CLASSES[i] for i in shown], result["f1"][shown],
+                       f"Classification Performance: F1 Score per Disaster Type ({name})",
+                       f"F1_Score_Performance_{name}.png")
+
+def main():
+    """Main function to handle command-line arguments."""
+    args = sys.argv[1:]
+    labeled_file = None
+    min_macro_f1 = 0.8
+    # Serial by default so per-call latency is not inflated by queueing
+    max_workers = 1
+    try:
+        while args:
+            option, value = args[0], args[1]
+            if option == "--labels":
+                labeled_file = value
+            elif option == "--min-f1":
+                min_macro_f1 = float(value)
+            elif option == "--workers":
+                max_workers = int(value)
+                if max_workers < 1:
+                    raise ValueError(value)
+            else:
+                raise ValueError(option)
+            args = args[2:]
+        if labeled_file is None:
+            raise ValueError("--labels")
+    except (IndexError, ValueError):
+        print("Usage: python evaluate_classifier.py --labels FILE [--min-f1 SCORE] [--workers N]")
+        print("FILE is a JSON list of human-labeled tweets with 'text', 'disaster_type' and 'extracted_location'.")
+        return
+
+    if os.path.basename(labeled_file) in PIPELINE_OUTPUT_FILES:
+        print(f"❌ {labeled_file} holds pipeline output, not human labels. Pass a human-labeled file.")
+        return
+
+    labeled_tweets = load_preprocessed_tweets(labeled_file)
+    if not labeled_tweets:
+        print(f"❌ No labeled tweets found in {labeled_file}. Nothing to evaluate.")
+        return
+
+    print(f"🚀 Evaluating {len(labeled_tweets)} labeled tweets...")
+    results = evaluate(labeled_tweets, get_extractors(), max_workers)
+    if not results:
+        print("❌ No extractor produced any predictions.")
+        return
+    print_report(results)
+    save_figures(results)
+
+    best = select_fastest(results, min_macro_f1)
+    if best:
+        print(f"\n✅ Fastest extractor with macro F1 >= {min_macro_f1}: {best}")
+    else:
+        print(f"\n❌ No extractor reached a macro F1 of {min_macro_f1}.")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
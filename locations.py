@@ -0,0 +1,12 @@
+# locations.py
+
+# --- Location Normalization ---
+LOCATION_ALIASES = {
+    "bangalore": "bengaluru",
+    "bombay": "mumbai"
+}
+
+def normalize_location(location):
+    """Normalizes location names using the alias dictionary."""
+    loc_lower = location.lower()
+    return LOCATION_ALIASES.get(loc_lower, loc_lower)
\ No newline at end of file
@@ -11,10 +11,10 @@ SMTP_SERVER = os.getenv("SMTP_SERVER", "smtp.gmail.com") # Default to Gmail if n
 SMTP_PORT = int(os.getenv("SMTP_PORT", 465)) # Default to 465 if not set
 
 def send_email_alert(to_email, subject, body):
-    """Sends an email alert with specific error handling."""
+    """Sends an email alert with specific error handling. Returns True if it was sent."""
     if not EMAIL_ADDRESS or not EMAIL_PASSWORD:
         print("❌ Email credentials not set in .env file. Cannot send email.")
-        return
+        return False
 
     msg = EmailMessage()
     msg["From"] = EMAIL_ADDRESS
@@ -27,10 +27,12 @@ def send_email_alert(to_email, subject, body):
             smtp.login(EMAIL_ADDRESS, EMAIL_PASSWORD)
             smtp.send_message(msg)
         print(f"📩 Alert sent to {to_email}")
+        return True
     except smtplib.SMTPAuthenticationError:
         print(f"❌ Authentication failed for {EMAIL_ADDRESS}. Check your email/password or app password.")
     except ConnectionRefusedError:
         print(f"❌ Connection refused by the server {SMTP_SERVER}. Check server/port settings.")
     except Exception as e:
         print(f"❌ An unexpected error occurred while sending email to {to_email}: {e}")
+    return False
 
@@ -1,17 +1,10 @@
 import json
+import sys
+import zlib
+from concurrent.futures import ProcessPoolExecutor
 from mail_alert import send_email_alert
 from user_db import get_subscribers_for_locations, check_if_alert_sent_recently, log_sent_alert
-
-# --- Location Normalization ---
-LOCATION_ALIASES = {
-    "bangalore": "bengaluru",
-    "bombay": "mumbai"
-}
-
-def normalize_location(location):
-    """Normalizes location names using the alias dictionary."""
-    loc_lower = location.lower()
-    return LOCATION_ALIASES.get(loc_lower, loc_lower)
+from locations import normalize_location
 
 def load_preprocessed_tweets(json_file):
     """Loads tweets from a JSON file that have already been analyzed."""
@@ -22,7 +15,9 @@ def group_and_send_alerts(disaster_tweets):
     """
     Groups alerts by normalized location and disaster, checks for duplicates,
     and sends one consolidated email per new event group.
+    Returns a metrics dictionary describing what was sent and skipped.
     """
+    metrics = new_metrics()
     alerts_to_group = {}
     unique_locations = set()
 
@@ -41,15 +36,20 @@ def group_and_send_alerts(disaster_tweets):
             
             alerts_to_group[alert_key].append(tweet)
 
+    metrics["tweets_processed"] = len(disaster_tweets)
+    metrics["event_groups"] = len(alerts_to_group)
+
     subscribers_map = get_subscribers_for_locations(list(unique_locations))
 
     for (location, disaster_type), tweets in alerts_to_group.items():
         if check_if_alert_sent_recently(location, disaster_type):
             print(f"🚫 Alert for {disaster_type} in {location} already sent recently. Skipping.")
+            metrics["skipped_duplicates"] += 1
             continue
 
         subscribers = subscribers_map.get(location, [])
         if not subscribers:
+            metrics["skipped_no_subscribers"] += 1
             continue
 
         email_body_parts = [f"Found {len(tweets)} report(s) for a {disaster_type.title()} in {location.title()}:\n"]
@@ -68,14 +68,94 @@ def group_and_send_alerts(disaster_tweets):
         
         print(f"Found new event: {disaster_type.title()} in {location.title()}. Notifying {len(subscribers)} subscriber(s).")
         for email in subscribers:
-            send_email_alert(email, subject, final_body)
+            if send_email_alert(email, subject, final_body):
+                metrics["emails_sent"] += 1
+            else:
+                metrics["emails_failed"] += 1
         
         log_sent_alert(location, disaster_type)
+        metrics["alerts_sent"].append((location, disaster_type))
+
+    return metrics
+
+# --- Sharded Execution ---
+
+def new_metrics():
+    """Returns an empty metrics dictionary for one alerting run."""
+    return {
+        "tweets_processed": 0,
+        "event_groups": 0,
+        "skipped_duplicates": 0,
+        "skipped_no_subscribers": 0,
+        "emails_sent": 0,
+        "emails_failed": 0,
+        "alerts_sent": []
+    }
+
+def merge_metrics(metrics_list):
+    """Combines the metrics returned by several shards into a single summary."""
+    merged = new_metrics()
+    for metrics in metrics_list:
+        for key, value in metrics.items():
+            if key == "alerts_sent":
+                merged[key].extend(value)
+            else:
+                merged[key] += value
+    merged["alerts_sent"].sort()
+    return merged
+
+def shard_for_location(location, num_shards):
+    """
+    Maps a location to a shard index using a stable hash of its normalized name.
+    crc32 is used instead of hash() so every worker process agrees on the result.
+    """
+    normalized_loc = normalize_location(location or "N/A")
+    return zlib.crc32(normalized_loc.encode("utf-8")) % num_shards
+
+def partition_tweets(disaster_tweets, num_shards):
+    """
+    Splits tweets into per-shard lists keyed by normalized location, so that every
+    (location, disaster) group and its dedup state live in exactly one shard.
+    """
+    shards = [[] for _ in range(num_shards)]
+    for tweet in disaster_tweets:
+        shards[shard_for_location(tweet.get("extracted_location"), num_shards)].append(tweet)
+    return shards
+
+def group_and_send_alerts_sharded(disaster_tweets, num_workers=4):
+    """
+    Runs group_and_send_alerts() across a pool of worker processes. Each shard owns
+    a disjoint set of locations, so grouping, duplicate checks and sending need no
+    cross-shard locking; the coordinator only merges the returned metrics.
+    """
+    if num_workers <= 1:
+        return group_and_send_alerts(disaster_tweets)
+
+    shards = [shard for shard in partition_tweets(disaster_tweets, num_workers) if shard]
+    if not shards:
+        return new_metrics()
+
+    print(f"🧩 Processing {len(disaster_tweets)} tweets across {len(shards)} shard(s).")
+    with ProcessPoolExecutor(max_workers=len(shards)) as executor:
+        shard_metrics = list(executor.map(group_and_send_alerts, shards))
+
+    return merge_metrics(shard_metrics)
 
 def main():
+    """Runs the alert pipeline; pass --workers N to shard it across N processes."""
+    args = sys.argv[1:]
+    num_workers = 1
+    if len(args) == 2 and args[0] == "--workers" and args[1].isdigit():
+        num_workers = int(args[1])
+    elif args:
+        print("Usage: python scraper.py [--workers N]")
+        return
+
     tweets = load_preprocessed_tweets("moc_tweets.json")
     print("🚀 Reading pre-analyzed file, grouping, and sending alerts...")
-    group_and_send_alerts(tweets)
+    metrics = group_and_send_alerts_sharded(tweets, num_workers)
+    print(f"📊 {metrics['event_groups']} event group(s), {len(metrics['alerts_sent'])} alert(s) sent, "
+          f"{metrics['emails_sent']} email(s) sent, {metrics['emails_failed']} failed, {metrics['skipped_duplicates']} duplicate(s) skipped.")
     print("✅ Process complete.")
 
 if __name__ == "__main__":
@@ -0,0 +1,63 @@
+import unittest
+from unittest import mock
+
+import scraper
+
+TWEETS = [
+    {"author_id": "1", "timestamp": "t1", "text": "flood", "extracted_location": "Bengaluru", "disaster_type": "Flood"},
+    {"author_id": "2", "timestamp": "t2", "text": "fire", "extracted_location": "bangalore", "disaster_type": "Fire"},
+    {"author_id": "3", "timestamp": "t3", "text": "flood", "extracted_location": "Mumbai", "disaster_type": "Flood"},
+    {"author_id": "4", "timestamp": "t4", "text": "flood", "extracted_location": "Bombay", "disaster_type": "flood"},
+    {"author_id": "5", "timestamp": "t5", "text": "fire", "extracted_location": "Delhi", "disaster_type": "Fire"},
+    {"author_id": "6", "timestamp": "t6", "text": "quake", "extracted_location": "Chennai", "disaster_type": "Earthquake"},
+    {"author_id": "7", "timestamp": "t7", "text": "none", "extracted_location": "N/A", "disaster_type": "N/A"},
+]
+
+class ShardingTest(unittest.TestCase):
+
+    def setUp(self):
+        # Delhi was alerted recently, Chennai has no subscribers, one Mumbai address fails
+        patches = [
+            mock.patch.object(scraper, "get_subscribers_for_locations",
+                              lambda locations: {loc: [] if loc == "chennai" else [f"{loc}@example.com", "bad@example.com"]
+                                                 for loc in locations}),
+            mock.patch.object(scraper, "check_if_alert_sent_recently", lambda location, disaster: location == "delhi"),
+            mock.patch.object(scraper, "log_sent_alert", lambda location, disaster: None),
+            mock.patch.object(scraper, "send_email_alert", lambda email, subject, body: email != "bad@example.com"),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def test_each_location_lands_in_exactly_one_shard(self):
+        for num_shards in range(1, 6):
+            shards = scraper.partition_tweets(TWEETS, num_shards)
+            self.assertEqual(sum(len(shard) for shard in shards), len(TWEETS))
+            owners = {}
+            for index, shard in enumerate(shards):
+                for tweet in shard:
+                    location = scraper.normalize_location(tweet["extracted_location"])
+                    self.assertEqual(owners.setdefault(location, index), index)
+
+    def test_aliases_share_a_shard(self):
+        for num_shards in range(1, 9):
+            self.assertEqual(scraper.shard_for_location("Bangalore", num_shards),
+                             scraper.shard_for_location("bengaluru", num_shards))
+            self.assertEqual(scraper.shard_for_location("Bombay", num_shards),
+                             scraper.shard_for_location("MUMBAI", num_shards))
+
+    def test_merged_shard_metrics_match_single_process_run(self):
+        expected = scraper.merge_metrics([scraper.group_and_send_alerts(TWEETS)])
+        for num_shards in range(1, 6):
+            shard_metrics = [scraper.group_and_send_alerts(shard)
+                             for shard in scraper.partition_tweets(TWEETS, num_shards)]
+            self.assertEqual(scraper.merge_metrics(shard_metrics), expected)
+
+        self.assertEqual(expected["event_groups"], 5)
+        self.assertEqual(expected["skipped_duplicates"], 1)
+        self.assertEqual(expected["skipped_no_subscribers"], 1)
+        self.assertEqual(expected["emails_sent"], 3)
+        self.assertEqual(expected["emails_failed"], 3)
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,243 @@
+# tweet_archive.py
+
+import json
+import os
+import sqlite3
+import sys
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from tweet_store import TWEET_DB_FILE
+from locations import normalize_location
+
+ARCHIVE_DIR = "tweet_archive"
+# Files starting with "_" are ignored by pyarrow when reading the dataset
+EXPORT_STATE_FILE = os.path.join(ARCHIVE_DIR, "_export_state.json")
+EXPORT_BATCH_SIZE = 50000
+
+RAW_COLUMNS = ["id", "author_id", "timestamp", "text", "image_url",
+               "extracted_location", "disaster_type", "detected_landmark"]
+
+# Raw columns plus the derived ones used for analytics; "date" is the partition key
+ARCHIVE_SCHEMA = pa.schema([
+    ("id", pa.int64()),
+    ("author_id", pa.string()),
+    ("timestamp", pa.string()),
+    ("text", pa.string()),
+    ("image_url", pa.string()),
+    ("extracted_location", pa.string()),
+    ("disaster_type", pa.string()),
+    ("detected_landmark", pa.string()),
+    ("location", pa.string()),
+    ("disaster", pa.string()),
+    ("hour", pa.int8()),
+    ("date", pa.string())
+])
+PARTITIONING = ds.partitioning(pa.schema([("date", pa.string())]), flavor="hive")
+
+# --- Export ---
+
+def _load_export_state():
+    """Returns the id of the last raw_tweets row already written to the archive."""
+    if not os.path.exists(EXPORT_STATE_FILE):
+        return 0
+    with open(EXPORT_STATE_FILE, "r", encoding="utf-8") as f:
+        return json.load(f).get("last_exported_id", 0)
+
+def _save_export_state(last_id):
+    """Records the export watermark so the next run only picks up new rows."""
+    with open(EXPORT_STATE_FILE, "w", encoding="utf-8") as f:
+        json.dump({"last_exported_id": last_id}, f)
+
+def _rows_to_table(rows, columns):
+    """Converts raw_tweets rows into an Arrow table with the derived analytics columns."""
+    records = {name: [] for name in ARCHIVE_SCHEMA.names}
+    for row in rows:
+        tweet = dict(zip(columns, row))
+        for name in RAW_COLUMNS:
+            records[name].append(tweet.get(name, "N/A"))
+        timestamp = tweet["timestamp"]
+        records["location"].append(normalize_location(tweet.get("extracted_location") or "N/A"))
+        records["disaster"].append((tweet.get("disaster_type") or "N/A").lower())
+        records["hour"].append(int(timestamp[11:13]) if timestamp[11:13].isdigit() else None)
+        records["date"].append(timestamp[:10])
+    return pa.Table.from_pydict(records, schema=ARCHIVE_SCHEMA)
+
+def export_new_tweets():
+    """
+    Incrementally exports raw_tweets rows that are not yet archived into
+    date-partitioned Parquet files. Returns the number of rows exported.
+    """
+    os.makedirs(ARCHIVE_DIR, exist_ok=True)
+    last_id = _load_export_state()
+
+    con = sqlite3.connect(TWEET_DB_FILE)
+    cur = con.cursor()
+    # Older databases were created before detected_landmark existed
+    existing = {row[1] for row in cur.execute("PRAGMA table_info(raw_tweets)")}
+    columns = [name for name in RAW_COLUMNS if name in existing]
+
+    res = cur.execute(
+        f"SELECT {', '.join(columns)} FROM raw_tweets WHERE id > ? ORDER BY id",
+        (last_id,)
+    )
+
+    exported = 0
+    while True:
+        rows = res.fetchmany(EXPORT_BATCH_SIZE)
+        if not rows:
+            break
+        table = _rows_to_table(rows, columns)
+        first_id, batch_last_id = rows[0][0], rows[-1][0]
+        # A crash before the watermark is saved re-exports a batch starting at the same
+        # id, so naming files by first id overwrites the partial batch with a superset
+        ds.write_dataset(
+            table, ARCHIVE_DIR, format="parquet", partitioning=PARTITIONING,
+            basename_template=f"part-{first_id}-{{i}}.parquet",
+            existing_data_behavior="overwrite_or_ignore"
+        )
+        _save_export_state(batch_last_id)
+        exported += len(rows)
+
+    con.close()
+    print(f"✅ Exported {exported} new tweets to the Parquet archive.")
+    return exported
+
+def _drop_duplicate_ids(table):
+    """Sorts a table by id and keeps one row per id."""
+    table = table.sort_by("id")
+    ids = table.column("id").to_numpy()
+    if len(ids) < 2:
+        return table
+    keep = np.concatenate(([True], ids[1:] != ids[:-1]))
+    return table.filter(pa.array(keep))
+
+def compact_archive():
+    """Merges the small files left by incremental exports into one file per date partition."""
+    if not os.path.isdir(ARCHIVE_DIR):
+        return
+
+    for entry in sorted(os.listdir(ARCHIVE_DIR)):
+        partition_dir = os.path.join(ARCHIVE_DIR, entry)
+        if not entry.startswith("date=") or not os.path.isdir(partition_dir):
+            continue
+        files = sorted(os.path.join(partition_dir, name) for name in os.listdir(partition_dir)
+                       if name.endswith(".parquet") and not name.startswith("_"))
+        if len(files) < 2:
+            continue
+
+        table = pq.read_table(files, schema=ARCHIVE_SCHEMA.remove(ARCHIVE_SCHEMA.get_field_index("date")))
+        # A batch re-exported after compaction no longer shares a file name with its
+        # earlier copy, so duplicates are dropped here
+        table = _drop_duplicate_ids(table)
+        ids = table.column("id")
+        # A different prefix from export files, so a re-export can never overwrite it
+        target = os.path.join(partition_dir, f"compacted-{ids[0].as_py()}-{ids[-1].as_py()}.parquet")
+        tmp_path = os.path.join(partition_dir, "_compacting.parquet")
+        pq.write_table(table, tmp_path)
+        # Publish the merged file before removing the sources so no rows are ever
+        # only reachable through an ignored "_" file
+        os.replace(tmp_path, target)
+        for path in files:
+            if path != target:
+                os.remove(path)
+        print(f"🗜️ Compacted {len(files)} files in {entry}.")
+
+# --- Query ---
+
+def _open_archive():
+    """Opens the archive as a hive-partitioned dataset, or returns None if it is empty."""
+    if not os.path.isdir(ARCHIVE_DIR):
+        return None
+    dataset = ds.dataset(ARCHIVE_DIR, format="parquet", partitioning=PARTITIONING, schema=ARCHIVE_SCHEMA)
+    if not dataset.files:
+        return None
+    return dataset
+
+def _read_archive(columns, expression, retries=3):
+    """
+    Reads only the given columns. The scan is retried if a compaction removes
+    a file between discovery and reading.
+    """
+    for attempt in range(retries):
+        dataset = _open_archive()
+        if dataset is None:
+            return None
+        try:
+            return dataset.to_table(columns=list(columns), filter=expression)
+        except (FileNotFoundError, pa.ArrowInvalid, OSError):
+            if attempt == retries - 1:
+                raise
+
+def _build_filter(start_date=None, end_date=None, locations=None, disaster_types=None):
+    """
+    Builds a dataset filter. Date bounds prune whole partitions; the other
+    predicates are pushed down to Parquet row-group statistics.
+    """
+    conditions = []
+    if start_date:
+        conditions.append(ds.field("date") >= str(start_date))
+    if end_date:
+        conditions.append(ds.field("date") <= str(end_date))
+    if locations:
+        conditions.append(ds.field("location").isin([normalize_location(loc) for loc in locations]))
+    if disaster_types:
+        conditions.append(ds.field("disaster").isin([d.lower() for d in disaster_types]))
+
+    expression = None
+    for condition in conditions:
+        expression = condition if expression is None else expression & condition
+    return expression
+
+def query_archive(columns=None, start_date=None, end_date=None, locations=None, disaster_types=None):
+    """
+    Reads only the requested columns of the archived tweets matching the filters.
+    Dates are ISO strings (YYYY-MM-DD) or date objects and are inclusive.
+    """
+    columns = columns or ARCHIVE_SCHEMA.names
+    expression = _build_filter(start_date, end_date, locations, disaster_types)
+    table = _read_archive(columns, expression)
+    if table is None:
+        return pd.DataFrame(columns=columns)
+    return table.to_pandas()
+
+def trend_counts(group_by=("location", "disaster", "hour"), start_date=None, end_date=None,
+                 locations=None, disaster_types=None):
+    """
+    Counts archived tweets per group (e.g. by city, disaster and hour), aggregating
+    in Arrow so only the grouping columns are ever loaded.
+    """
+    group_by = list(group_by)
+    expression = _build_filter(start_date, end_date, locations, disaster_types)
+    table = _read_archive(group_by, expression)
+    if table is None:
+        return pd.DataFrame(columns=group_by + ["count"])
+
+    counts = table.group_by(group_by).aggregate([([], "count_all")])
+    counts = counts.rename_columns(["count" if name == "count_all" else name for name in counts.column_names])
+    return counts.to_pandas().sort_values(group_by).reset_index(drop=True)
+
+def main():
+    """Main function to handle command-line arguments."""
+    args = sys.argv[1:]
+    if not args:
+        print("Usage: python tweet_archive.py <command>")
+        print("Commands: export, compact, trends")
+        return
+
+    command = args[0]
+    if command == "export":
+        export_new_tweets()
+    elif command == "compact":
+        compact_archive()
+    elif command == "trends":
+        print(trend_counts().to_string(index=False))
+    else:
+        print("Invalid command.")
+
+if __name__ == "__main__":
+    main()
@@ -2,8 +2,12 @@ import requests
 import os
 import json
 import ollama
+from concurrent.futures import ThreadPoolExecutor
 from tweet_store import initialize_tweet_database, save_tweets_to_db
 
+# Concurrent requests sent to the local Ollama server during analysis
+ANALYSIS_WORKERS = 4
+
 def extract_disaster_info(tweet_text):
     """
     Uses Ollama with llama3 to extract location and disaster type from a tweet.
@@ -69,6 +73,42 @@ def analyze_image_for_landmarks(image_url):
         print(f"CV Error: An issue occurred with Ollama/LLaVA. {e}")
         return "Analysis Error"
 
+def analyze_tweet(tweet, media_map):
+    """Extracts disaster info and image landmarks for one raw API tweet."""
+    tweet_text = tweet['text']
+    location, disaster_type = extract_disaster_info(tweet_text)
+    image_url = "N/A"
+    detected_landmark = "N/A"
+
+    if "attachments" in tweet and "media_keys" in tweet["attachments"]:
+        for key in tweet["attachments"]["media_keys"]:
+            if key in media_map and media_map[key]:
+                image_url = media_map[key]
+                detected_landmark = analyze_image_for_landmarks(image_url)
+                break
+
+    return {
+        "author_id": tweet['author_id'],
+        "timestamp": tweet['created_at'],
+        "text": tweet_text,
+        "extracted_location": location,
+        "disaster_type": disaster_type,
+        "image_url": image_url,
+        "detected_landmark": detected_landmark
+    }
+
+def analyze_tweets(tweets, media_map, num_workers=ANALYSIS_WORKERS):
+    """
+    Analyzes tweets concurrently, preserving their order. Each tweet is independent
+    and the work happens in the Ollama server, so a thread pool is enough; set
+    OLLAMA_NUM_PARALLEL on the server so it actually serves requests in parallel.
+    """
+    if num_workers <= 1:
+        return [analyze_tweet(tweet, media_map) for tweet in tweets]
+
+    with ThreadPoolExecutor(max_workers=num_workers) as executor:
+        return list(executor.map(lambda tweet: analyze_tweet(tweet, media_map), tweets))
+
 def create_headers(bearer_token):
     """Creates the necessary authorization headers for the API request."""
     headers = {"Authorization": f"Bearer {bearer_token}"}
@@ -111,29 +151,7 @@ def main():
         media_map = {media["media_key"]: media.get("url") for media in media_includes}
 
         print("\n--- Analyzing Tweets ---")
-        for tweet in json_response["data"]:
-            tweet_text = tweet['text']
-            location, disaster_type = extract_disaster_info(tweet_text)
-            image_url = "N/A"
-            detected_landmark = "N/A"
-            
-            if "attachments" in tweet and "media_keys" in tweet["attachments"]:
-                for key in tweet["attachments"]["media_keys"]:
-                    if key in media_map and media_map[key]:
-                        image_url = media_map[key]
-                        detected_landmark = analyze_image_for_landmarks(image_url)
-                        break
-            
-            processed_tweet = {
-                "author_id": tweet['author_id'],
-                "timestamp": tweet['created_at'],
-                "text": tweet_text,
-                "extracted_location": location,
-                "disaster_type": disaster_type,
-                "image_url": image_url,
-                "detected_landmark": detected_landmark
-            }
-            results_list.append(processed_tweet)
+        results_list = analyze_tweets(json_response["data"], media_map)
     else:
         print("No tweets found for the query.")
 